@@ -1,5 +1,6 @@
 """Functions to compute the bounding box describing the extent of a SpatialElement or region."""
 import numpy as np
+import shapely
 from geopandas import GeoDataFrame
 from shapely import Point
 
@@ -24,11 +25,10 @@ def _get_bounding_box_of_circle_elements(shapes: GeoDataFrame) -> tuple[ArrayLik
         raise NotImplementedError("Only circles (shapely Point) are currently supported (not Polygon or MultiPolygon).")
     circle_dims = get_axes_names(circle_element)
 
-    centroids = []
-    for dim_name in circle_dims:
-        centroids.append(getattr(circle_element["geometry"], dim_name).to_numpy())
-    centroids_array = np.column_stack(centroids)
-    radius = np.expand_dims(circle_element["radius"].to_numpy(), axis=1)
+    # shapely returns the coordinates in the (x, y, z) order, we reorder the columns to match the axes of the element
+    coordinates = shapely.get_coordinates(circle_element.geometry.values, include_z="z" in circle_dims)
+    centroids_array = coordinates[:, [("x", "y", "z").index(dim_name) for dim_name in circle_dims]]
+    radius = circle_element["radius"].to_numpy()[:, np.newaxis]
 
     min_coordinates = (centroids_array - radius).astype(int)
     max_coordinates = (centroids_array + radius).astype(int)
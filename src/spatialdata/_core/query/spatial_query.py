@@ -233,15 +233,16 @@ def _bounding_box_mask_points(
     """
     min_coordinate = _parse_list_into_array(min_coordinate)
     max_coordinate = _parse_list_into_array(max_coordinate)
-    in_bounding_box_masks = []
+    # combine the masks lazily and convert to a dask array only once: each conversion with lengths=True triggers a
+    # computation of the partition lengths
+    in_bounding_box_mask = None
     for axis_index, axis_name in enumerate(axes):
         min_value = min_coordinate[axis_index]
-        in_bounding_box_masks.append(points[axis_name].gt(min_value).to_dask_array(lengths=True))
-    for axis_index, axis_name in enumerate(axes):
         max_value = max_coordinate[axis_index]
-        in_bounding_box_masks.append(points[axis_name].lt(max_value).to_dask_array(lengths=True))
-    in_bounding_box_masks = da.stack(in_bounding_box_masks, axis=-1)
-    return da.all(in_bounding_box_masks, axis=1)
+        axis_mask = points[axis_name].gt(min_value) & points[axis_name].lt(max_value)
+        in_bounding_box_mask = axis_mask if in_bounding_box_mask is None else in_bounding_box_mask & axis_mask
+    assert in_bounding_box_mask is not None
+    return in_bounding_box_mask.to_dask_array(lengths=True)
 
 
 def _dict_query_dispatcher(
@@ -445,14 +446,17 @@ def _(
     )
 
     # build the request
+    # reduce over the corners once for all the axes, instead of once per axis
+    min_values = intrinsic_bounding_box_corners.min(dim="corner")
+    max_values = intrinsic_bounding_box_corners.max(dim="corner")
     selection = {}
     translation_vector = []
     for axis_name in axes:
         # get the min value along the axis
-        min_value = intrinsic_bounding_box_corners.sel(axis=axis_name).min().item()
+        min_value = min_values.sel(axis=axis_name).item()
 
         # get max value, slices are open half interval
-        max_value = intrinsic_bounding_box_corners.sel(axis=axis_name).max().item()
+        max_value = max_values.sel(axis=axis_name).item()
 
         # add the
         selection[axis_name] = slice(min_value, max_value)
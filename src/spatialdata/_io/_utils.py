@@ -6,11 +6,17 @@ import os.path
 import re
 import tempfile
 from collections.abc import Generator, Mapping
+from concurrent.futures import Executor, ThreadPoolExecutor
 from contextlib import contextmanager
 from functools import singledispatch
 from typing import TYPE_CHECKING, Any
 
 import zarr
+
+try:
+    from blake3 import blake3 as _file_hasher
+except ImportError:
+    from hashlib import blake2b as _file_hasher  # type: ignore[assignment]
 from dask.dataframe.core import DataFrame as DaskDataFrame
 from multiscale_spatial_image import MultiscaleSpatialImage
 from ome_zarr.format import Format
@@ -139,62 +145,191 @@ def _iter_multiscale(
     return [data[i][name] for i in data]
 
 
+_HASH_BUFFER_SIZE = 1 << 20
+# digests of the files hashed so far, keyed by (path, st_mtime_ns, st_size) so that a file rewritten on disk is rehashed
+_file_digest_cache: dict[tuple[str, int, int], bytes] = {}
+
+
+def _file_digest(path: str, stat: os.stat_result) -> bytes:
+    """Return the digest of the content of a file, reusing the cached value if the file has not changed."""
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    digest = _file_digest_cache.get(key)
+    if digest is None:
+        hasher = _file_hasher()
+        with open(path, "rb") as f:
+            while buf := f.read(_HASH_BUFFER_SIZE):
+                hasher.update(buf)
+        digest = hasher.digest()
+        _file_digest_cache[key] = digest
+    return digest
+
+
+def _scandir_file_stats(path: str) -> dict[str, os.stat_result]:
+    """Return the stat of the files contained in a directory, indexed by name."""
+    with os.scandir(path) as it:
+        return {entry.name: entry.stat() for entry in it if entry.is_file()}
+
+
 class dircmp(filecmp.dircmp):  # type: ignore[type-arg]
     """
     Compare the content of dir1 and dir2.
 
     In contrast with filecmp.dircmp, this
     subclass compares the content of files with the same path.
+
+    If `fast` is True, files with the same size and modification time are considered identical without reading them.
+    If an `executor` is passed, the content of the files is read and hashed concurrently.
     """
 
-    # from https://stackoverflow.com/a/24860799/3343783
+    def __init__(
+        self,
+        a: Any,
+        b: Any,
+        ignore: list[str] | None = None,
+        hide: list[str] | None = None,
+        fast: bool = False,
+        executor: Executor | None = None,
+    ) -> None:
+        super().__init__(a, b, ignore=ignore, hide=hide)
+        self.fast = fast
+        self.executor = executor
+
+    def _compare_contents(self, name: str, left_stat: os.stat_result, right_stat: os.stat_result) -> bool | None:
+        """Compare the digests of a common file, return None if the file can't be read."""
+        try:
+            left_digest = _file_digest(os.path.join(self.left, name), left_stat)
+            right_digest = _file_digest(os.path.join(self.right, name), right_stat)
+        except OSError:
+            return None
+        return left_digest == right_digest
+
     def phase3(self) -> None:
         """
         Differences between common files.
 
-        Ensure we are using content comparison with shallow=False.
+        Files with different sizes are different. The content of the remaining files is compared by hashing each file
+        once; the digests are cached across calls.
         """
-        fcomp = filecmp.cmpfiles(self.left, self.right, self.common_files, shallow=False)
-        self.same_files, self.diff_files, self.funny_files = fcomp
+        same_files, diff_files, funny_files = [], [], []
+        left_stats = _scandir_file_stats(self.left)
+        right_stats = _scandir_file_stats(self.right)
+        to_read = []
+        for name in self.common_files:
+            left_stat = left_stats.get(name)
+            right_stat = right_stats.get(name)
+            if left_stat is None or right_stat is None:
+                funny_files.append(name)
+            elif left_stat.st_size != right_stat.st_size:
+                diff_files.append(name)
+            elif self.fast and left_stat.st_mtime_ns == right_stat.st_mtime_ns:
+                same_files.append(name)
+            else:
+                to_read.append(name)
+
+        def compare(name: str) -> bool | None:
+            return self._compare_contents(name, left_stats[name], right_stats[name])
+
+        results = map(compare, to_read) if self.executor is None else self.executor.map(compare, to_read)
+        for name, identical in zip(to_read, results):
+            if identical is None:
+                funny_files.append(name)
+            else:
+                (same_files if identical else diff_files).append(name)
+        self.same_files, self.diff_files, self.funny_files = same_files, diff_files, funny_files
+
+    # filecmp.dircmp dispatches the lazy attributes through a class-level map holding its own phase functions, so the
+    # map needs to point to the overridden phase3
+    methodmap = dict(filecmp.dircmp.methodmap, same_files=phase3, diff_files=phase3, funny_files=phase3)
 
 
 def _are_directories_identical(
     dir1: Any,
     dir2: Any,
     exclude_regexp: str | None = None,
-    _root_dir1: str | None = None,
-    _root_dir2: str | None = None,
+    fast: bool = False,
+    _exclude_patterns: tuple[re.Pattern[str], re.Pattern[str]] | None = None,
+    _executor: Executor | None = None,
 ) -> bool:
     """
     Compare two directory trees content.
 
-    Return False if they differ, True is they are the same.
+    Return False if they differ, True is they are the same. If `fast` is True, files with the same size and
+    modification time are trusted to be identical (see `dircmp`).
     """
-    if _root_dir1 is None:
-        _root_dir1 = dir1
-    if _root_dir2 is None:
-        _root_dir2 = dir2
-    if exclude_regexp is not None and (
-        re.match(rf"{_root_dir1}/" + exclude_regexp, str(dir1))
-        or re.match(rf"{_root_dir2}/" + exclude_regexp, str(dir2))
+    if _executor is None:
+        if exclude_regexp is not None:
+            # compiled once for the whole tree, anchored to the root directories
+            _exclude_patterns = (
+                re.compile(re.escape(str(dir1)) + "/" + exclude_regexp),
+                re.compile(re.escape(str(dir2)) + "/" + exclude_regexp),
+            )
+        # the files are read and hashed in a thread pool shared by the whole tree; the directories are still visited
+        # by the calling thread, so that no task in the pool ever waits for another task of the same pool
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            return _are_directories_identical(
+                dir1, dir2, fast=fast, _exclude_patterns=_exclude_patterns, _executor=executor
+            )
+    if _exclude_patterns is not None and (
+        _exclude_patterns[0].match(str(dir1)) or _exclude_patterns[1].match(str(dir2))
     ):
         return True
 
-    compared = dircmp(dir1, dir2)
+    compared = dircmp(dir1, dir2, fast=fast, executor=_executor)
     if compared.left_only or compared.right_only or compared.diff_files or compared.funny_files:
         return False
     for subdir in compared.common_dirs:
         if not _are_directories_identical(
             os.path.join(dir1, subdir),
             os.path.join(dir2, subdir),
-            exclude_regexp=exclude_regexp,
-            _root_dir1=_root_dir1,
-            _root_dir2=_root_dir2,
+            fast=fast,
+            _exclude_patterns=_exclude_patterns,
+            _executor=_executor,
         ):
             return False
     return True
 
 
+def _dir_merkle_hash(
+    root: Any,
+    exclude_regexp: str | None = None,
+    _exclude_pattern: re.Pattern[str] | None = None,
+    _executor: Executor | None = None,
+) -> bytes:
+    """
+    Compute a digest of the content of a directory tree.
+
+    Each directory is hashed from the sorted names of its entries, together with the digests of its files and
+    (recursively) of its subdirectories. Two trees have the same digest if and only if they have the same content, so
+    comparing a tree against several others requires hashing each tree only once. Subdirectories matching
+    `exclude_regexp` (relative to `root`) only contribute their name, as in `_are_directories_identical`.
+    """
+    if _executor is None:
+        if exclude_regexp is not None:
+            _exclude_pattern = re.compile(re.escape(str(root)) + "/" + exclude_regexp)
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            return _dir_merkle_hash(root, _exclude_pattern=_exclude_pattern, _executor=executor)
+
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+    files = [entry for entry in entries if entry.is_file()]
+    file_digests = dict(
+        zip((entry.name for entry in files), _executor.map(lambda entry: _file_digest(entry.path, entry.stat()), files))
+    )
+    hasher = _file_hasher()
+    for entry in entries:
+        name = entry.name.encode()
+        if entry.name in file_digests:
+            hasher.update(b"f" + name + b"\0" + file_digests[entry.name])
+        elif not entry.is_dir():
+            raise ValueError(f"Unsupported directory entry: {entry.path}")
+        elif _exclude_pattern is not None and _exclude_pattern.match(str(entry.path)):
+            hasher.update(b"x" + name + b"\0")
+        else:
+            subdir_digest = _dir_merkle_hash(entry.path, _exclude_pattern=_exclude_pattern, _executor=_executor)
+            hasher.update(b"d" + name + b"\0" + subdir_digest)
+    return hasher.digest()
+
+
 def _compare_sdata_on_disk(a: SpatialData, b: SpatialData) -> bool:
     from spatialdata import SpatialData
 
@@ -5,6 +5,8 @@ from collections.abc import Generator
 from copy import deepcopy
 from typing import TYPE_CHECKING, Union
 
+import dask
+import numba
 import numpy as np
 import pandas as pd
 from anndata import AnnData
@@ -63,6 +65,26 @@ def _affine_matrix_multiplication(matrix: ArrayLike, data: ArrayLike) -> ArrayLi
     return result  # type: ignore[no-any-return]
 
 
+@numba.njit(parallel=True, cache=True)
+def _abs_sum_rows(rows: ArrayLike) -> ArrayLike:
+    out = np.zeros(rows.shape[0], dtype=np.float64)
+    for i in numba.prange(rows.shape[0]):
+        acc = 0.0
+        for j in range(rows.shape[1]):
+            acc += abs(np.float64(rows[i, j]))
+        out[i] = acc
+    return out
+
+
+def _abs_sum_along_axis(block: ArrayLike, keep_axis: int) -> ArrayLike:
+    """Sum the absolute values of a numpy array over all the axes but one, keeping the dimensions of the array."""
+    moved = np.moveaxis(block, keep_axis, 0)
+    rows = np.ascontiguousarray(moved.reshape(moved.shape[0], -1))
+    shape = [1] * block.ndim
+    shape[keep_axis] = block.shape[keep_axis]
+    return _abs_sum_rows(rows).reshape(shape)  # type: ignore[no-any-return]
+
+
 def unpad_raster(raster: SpatialImage | MultiscaleSpatialImage) -> SpatialImage | MultiscaleSpatialImage:
     """
     Remove padding from a raster type that was eventually added by the rotation component of a transformation.
@@ -80,14 +102,22 @@ def unpad_raster(raster: SpatialImage | MultiscaleSpatialImage) -> SpatialImage
     from spatialdata.transformations._utils import compute_coordinates
 
     def _compute_paddings(data: DataArray, axis: str) -> tuple[int, int]:
-        others = list(data.dims)
-        others.remove(axis)
+        keep_axis = data.dims.index(axis)
+        array = data.data
+        # each block is reduced in a single pass by a numba kernel, the partial sums of the blocks are then summed
+        if isinstance(array, da.Array):
+            chunks = tuple(c if i == keep_axis else (1,) * len(c) for i, c in enumerate(array.chunks))
+            partial_sums = array.map_blocks(_abs_sum_along_axis, keep_axis=keep_axis, chunks=chunks, dtype=np.float64)
+            sums = partial_sums.sum(axis=tuple(i for i in range(array.ndim) if i != keep_axis))
+        else:
+            sums = _abs_sum_along_axis(np.asarray(array), keep_axis).ravel()
         # mypy (luca's pycharm config) can't see the isclose method of dask array
-        s = da.isclose(data.sum(dim=others), 0)  # type: ignore[attr-defined]
-        # TODO: rewrite this to use dask array; can't get it to work with it
-        x = s.compute()
-        non_zero = np.where(x == 0)[0]
-        if len(non_zero) == 0:
+        non_zero = ~da.isclose(sums, 0)  # type: ignore[attr-defined]
+        # argmax() returns the first True value; only the three scalars are computed, in a single graph execution
+        left_pad, right_pad_from_end, n_non_zero = dask.compute(
+            non_zero.argmax(), non_zero[::-1].argmax(), non_zero.sum()
+        )
+        if n_non_zero == 0:
             min_coordinate, max_coordinate = data.coords[axis].min().item(), data.coords[axis].max().item()
             if not min_coordinate != 0:
                 raise ValueError(
@@ -102,9 +132,8 @@ def unpad_raster(raster: SpatialImage | MultiscaleSpatialImage) -> SpatialImage
                 )
             return 0, data.shape[data.dims.index(axis)]
 
-        left_pad = non_zero[0]
-        right_pad = non_zero[-1] + 1
-        return left_pad, right_pad
+        right_pad = len(non_zero) - int(right_pad_from_end)
+        return int(left_pad), right_pad
 
     axes = get_axes_names(raster)
     translation_axes = []
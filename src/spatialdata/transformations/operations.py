@@ -3,6 +3,7 @@ from __future__ import annotations
 import contextlib
 from typing import TYPE_CHECKING, Optional, Union
 
+import dask
 import networkx as nx
 import numpy as np
 from dask.dataframe import DataFrame as DaskDataFrame
@@ -348,8 +349,10 @@ def get_transformation_between_landmarks(
         references_xy = np.stack([references_coords.geometry.x, references_coords.geometry.y], axis=1)
         moving_xy = np.stack([moving_coords.geometry.x, moving_coords.geometry.y], axis=1)
     elif isinstance(references_coords, DaskDataFrame):
-        references_xy = references_coords[["x", "y"]].to_dask_array().compute()
-        moving_xy = moving_coords[["x", "y"]].to_dask_array().compute()
+        # a single call to compute() so that dask can execute the two graphs together
+        references_xy, moving_xy = dask.compute(
+            references_coords[["x", "y"]].to_dask_array(), moving_coords[["x", "y"]].to_dask_array()
+        )
     else:
         raise TypeError("references_coords must be either an GeoDataFrame or a DaskDataFrame")
 
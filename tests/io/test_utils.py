@@ -5,7 +5,7 @@ import dask.dataframe as dd
 import numpy as np
 import pytest
 from spatialdata import read_zarr, save_transformations
-from spatialdata._io._utils import get_backing_files
+from spatialdata._io._utils import _are_directories_identical, _dir_merkle_hash, get_backing_files
 from spatialdata._utils import multiscale_spatial_image_from_data_tree
 from spatialdata.transformations import Scale, get_transformation, set_transformation
 
@@ -94,3 +94,49 @@ def test_save_transformations(labels):
         scale0 = get_transformation(labels0.labels["labels2d"])
         assert isinstance(scale0, Scale)
         assert np.array_equal(scale.scale, scale0.scale)
+
+
+def test_are_directories_identical(tmp_path):
+    for name in ["a", "b"]:
+        os.makedirs(tmp_path / name / "sub")
+        (tmp_path / name / "f").write_bytes(b"content")
+        (tmp_path / name / "sub" / "g").write_bytes(b"nested content")
+    assert _are_directories_identical(tmp_path / "a", tmp_path / "b")
+
+    (tmp_path / "b" / "sub" / "g").write_bytes(b"nested CONTENT")
+    assert not _are_directories_identical(tmp_path / "a", tmp_path / "b")
+    assert _are_directories_identical(tmp_path / "a", tmp_path / "b", exclude_regexp="sub")
+
+    (tmp_path / "b" / "h").write_bytes(b"")
+    assert not _are_directories_identical(tmp_path / "a", tmp_path / "b", exclude_regexp="sub")
+
+
+def test_are_directories_identical_fast(tmp_path):
+    for name in ["a", "b"]:
+        os.makedirs(tmp_path / name)
+    (tmp_path / "a" / "f").write_bytes(b"abc")
+    (tmp_path / "b" / "f").write_bytes(b"abd")
+    st = os.stat(tmp_path / "a" / "f")
+    os.utime(tmp_path / "b" / "f", ns=(st.st_atime_ns, st.st_mtime_ns))
+    # same size and mtime: the fast mode trusts the metadata, the default mode reads the content
+    assert _are_directories_identical(tmp_path / "a", tmp_path / "b", fast=True)
+    assert not _are_directories_identical(tmp_path / "a", tmp_path / "b")
+
+
+def test_dir_merkle_hash(tmp_path):
+    for name in ["a", "b", "c"]:
+        os.makedirs(tmp_path / name / "sub")
+        (tmp_path / name / "f").write_bytes(b"content")
+        (tmp_path / name / "sub" / "g").write_bytes(b"nested content")
+    (tmp_path / "c" / "sub" / "g").write_bytes(b"nested CONTENT")
+    a, b, c = (_dir_merkle_hash(tmp_path / name) for name in ["a", "b", "c"])
+    assert a == b
+    assert a != c
+    assert _dir_merkle_hash(tmp_path / "a", exclude_regexp="sub") == _dir_merkle_hash(
+        tmp_path / "c", exclude_regexp="sub"
+    )
+
+    # a file and an empty directory with the same name are different
+    (tmp_path / "a" / "h").write_bytes(b"")
+    os.makedirs(tmp_path / "b" / "h")
+    assert _dir_merkle_hash(tmp_path / "a") != _dir_merkle_hash(tmp_path / "b")